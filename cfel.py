@@ -1,7 +1,8 @@
+import functools
 import re
 import requests
-from bs4 import BeautifulSoup
 from deep_translator import GoogleTranslator
+from selectolax.lexbor import LexborHTMLParser
 
 CFEL_URL = "https://www.stwhh.de/gastronomie/mensen-cafes-weiteres/mensa/cafe-cfel"
 HEADERS = {
@@ -9,26 +10,41 @@ HEADERS = {
 }
 
 PRICE_RE = re.compile(r"(\d+[.,]\d{2})\s*€")
-paren_re = re.compile(r"\s*\([^)]*\)")
+# one fused pattern: parentheses block | comma with surrounding space
+_CLEAN_RE = re.compile(r"\s*\([^)]*\)|\s*,\s*")
 translator = GoogleTranslator(source="auto", target="en")
 
 
+def _clean_repl(m: re.Match) -> str:
+    # drop parentheses blocks, normalize comma spacing
+    return "" if "(" in m.group(0) else ", "
+
+
 def clean_text(s: str) -> str:
-    # 1) remove parentheses blocks
-    no_paren = paren_re.sub("", s)
-    # 2) normalize whitespace and commas
-    cleaned = re.sub(r"\s+,", ",", no_paren)  # fix stray space before comma
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()  # collapse multiple spaces
-    # optional: ensure commas are followed by a single space
-    cleaned = re.sub(r",\s*", ", ", cleaned)
-    return cleaned
+    # fused comma/paren pass, then one split/join to collapse whitespace —
+    # including runs the replacements themselves leave behind
+    return " ".join(_CLEAN_RE.sub(_clean_repl, s).split())
+
+
+def _needs_translation(s: str) -> bool:
+    """Cheap local gate before the translation RTT: headlines that are pure
+    ASCII (no umlauts/ß possible) are already English on this site."""
+    return not s.isascii()
+
+
+@functools.lru_cache(maxsize=512)
+def _translate_cached(s: str) -> str:
+    """Memoized wrapper so repeated headlines hit the network only once."""
+    return translator.translate(s)
 
 
 def translate(s: str) -> str:
     cleaned = clean_text(s)
-    # translate if there's non-ASCII or if language is not English
+    # translate only if there's non-ASCII text (otherwise already English)
+    if not _needs_translation(cleaned):
+        return cleaned
     try:
-        translated = translator.translate(cleaned)
+        translated = _translate_cached(cleaned)
         return translated
     except Exception as e:
         # fallback: return cleaned text if translation fails
@@ -36,6 +52,15 @@ def translate(s: str) -> str:
         return cleaned
 
 
+def _translate_batch(texts):
+    """Translate several cleaned headlines in one request instead of N."""
+    try:
+        return translator.translate_batch(texts)
+    except Exception as e:
+        print("Batch translation failed, translating individually. Error:", e)
+        return [translate(t) for t in texts]
+
+
 def parse_price(text):
     """Return float price or None. Handles '4,30 €' -> 4.30"""
     m = PRICE_RE.search(text)
@@ -48,61 +73,62 @@ def parse_price(text):
         return None
 
 
-def scrape_headlines_and_prices(url):
-    resp = requests.get(url, headers=HEADERS, timeout=15)
+def scrape_headlines_and_prices(url, session=None):
+    resp = (session or requests).get(url, headers=HEADERS, timeout=15)
     resp.raise_for_status()
     resp.encoding = resp.apparent_encoding
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = LexborHTMLParser(resp.text)
 
     results = []
-    for meal in soup.select("div.singlemeal"):
+    pending = []  # (index into results, cleaned headline) awaiting translation
+    for meal in tree.css("div.singlemeal"):
         item = {"headline": None, "student_price": None, "employee_price": None}
 
-        # headline
-        h = meal.select_one("h5.singlemeal__headline")
+        # headline (translated in one batch below, after the loop)
+        h = meal.css_first("h5.singlemeal__headline")
         if h:
-            cleaned_text = clean_text(" ".join(h.get_text(" ", strip=True).split()))
-            item["headline"] = translate(cleaned_text)
+            cleaned_text = clean_text(" ".join(h.text(separator=" ").split()))
+            if _needs_translation(cleaned_text):
+                pending.append((len(results), cleaned_text))
+            else:
+                item["headline"] = cleaned_text
 
         # find price dd elements inside this meal
         # usually there are dd elements with the text and a nested span containing the price
-        dd_elements = meal.select("dd.dlist__item, .singlemeal__bottom dd")
+        # selectolax yields a node once per matching selector in the group, so
+        # a dd hit by both halves comes back twice; dedupe by the underlying
+        # node address while keeping document order
+        dd_elements = []
+        seen = set()
+        for dd in meal.css("dd.dlist__item, .singlemeal__bottom dd"):
+            if dd.mem_id not in seen:
+                seen.add(dd.mem_id)
+                dd_elements.append(dd)
 
         # First try to match by label words (Studierende / Bedienstete / Bedienstete)
         for dd in dd_elements:
-            text = dd.get_text(" ", strip=True)
+            text = " ".join(dd.text(separator=" ").split())
             price = parse_price(text)
             lower = text.lower()
             if price is not None:
-                if "stud" in lower or "studierende" in lower or "student" in lower:
+                # 'stud' covers Studierende/Student(en); 'gäste' is guests and
+                # deliberately maps to neither price
+                if "stud" in lower:
                     item["student_price"] = price
-                elif (
-                    "bedienst" in lower
-                    or "bedienstete" in lower
-                    or "mitarbeit" in lower
-                    or "bedienstete" in lower
-                    or "gäste" in lower
-                    and False
-                ):
-                    # we specifically check for employee-like words; 'gäste' is guests so we DON'T map it to employee
-                    item["employee_price"] = price
-                elif (
-                    "bedienstete" in lower
-                    or "bedienstete" in lower
-                    or "bediensteten" in lower
-                    or "bedienst" in lower
-                ):
+                elif "bedienst" in lower or "mitarbeit" in lower:
                     item["employee_price"] = price
 
         # Fallback: if we didn't find by labels, try positional fallback:
         # On this site the order seems to be: Studierende, Bedienstete, Gäste
         if item["student_price"] is None or item["employee_price"] is None:
-            # extract all prices in order
-            prices_in_order = []
-            for dd in dd_elements:
-                p = parse_price(dd.get_text(" ", strip=True) or "")
-                if p is not None:
-                    prices_in_order.append(p)
+            # extract all prices in order: one findall over the combined text
+            # instead of a regex call per dd element
+            combined = " | ".join(
+                " ".join(dd.text(separator=" ").split()) for dd in dd_elements
+            )
+            prices_in_order = [
+                float(p.replace(",", ".")) for p in PRICE_RE.findall(combined)
+            ]
             if len(prices_in_order) >= 2:
                 if item["student_price"] is None:
                     item["student_price"] = prices_in_order[0]
@@ -111,6 +137,12 @@ def scrape_headlines_and_prices(url):
 
         results.append(item)
 
+    # one batched translation request instead of one RTT per headline
+    if pending:
+        translated = _translate_batch([text for _, text in pending])
+        for (idx, _), headline in zip(pending, translated):
+            results[idx]["headline"] = headline
+
     return results
 
 
@@ -3,13 +3,15 @@ import re
 import requests
 import pdfplumber
 from datetime import datetime
+from itertools import chain
 from zoneinfo import ZoneInfo
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 # --- Constants ---
 PRICE_RE = re.compile(r"€\s*([\d\.,]+)")
 NUTRITION_KEYWORDS = ("kcal", "P:", "F:", "C:")
 ALLERGENS_RE = re.compile(r"^[\d\)\(\s\.\-\,/]+$")
+BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
 
 # --- Core Functions ---
@@ -21,22 +23,29 @@ def clean_menu_text(header: List[str], daily_menu: List[str]) -> str:
     """
     lines_out = []
 
-    for hdr, cell in zip(header, daily_menu):
-        if not hdr or not hdr.strip() or not cell:
+    # Header labels don't vary per cell, so normalize them once up front.
+    label_map = [
+        ("Menu 1" if h.lower().startswith("main") else h.strip())
+        if h and h.strip()
+        else None
+        for h in header
+    ]
+
+    for label, cell in zip(label_map, daily_menu):
+        if label is None or not cell:
             continue
 
-        label = "Menu 1" if hdr.lower().startswith("main") else hdr.strip()
-        lines = [ln.strip() for ln in cell.splitlines() if ln.strip()]
-
-        # Extract price
-        price = None
-        for i, ln in enumerate(lines):
-            match = PRICE_RE.search(ln)
-            if match:
-                price = f"{float(match.group(1).replace(',', '.')):.2f}€"
-                title_lines = lines[:i]
-                break
+        # Extract price: one regex call over the whole cell, not one per line
+        match = PRICE_RE.search(cell)
+        if match:
+            price = f"{float(match.group(1).replace(',', '.')):.2f}€"
+            # keep only the lines above the one holding the price
+            cut = cell.rfind("\n", 0, match.start())
+            head = cell[:cut] if cut != -1 else ""
+            title_lines = [ln.strip() for ln in head.splitlines() if ln.strip()]
         else:
+            price = None
+            lines = [ln.strip() for ln in cell.splitlines() if ln.strip()]
             # Drop nutrition/allergen lines if no price found
             title_lines = [
                 ln
@@ -56,32 +65,55 @@ def clean_menu_text(header: List[str], daily_menu: List[str]) -> str:
     return "\n".join(lines_out)
 
 
-def fetch_menu_pdf(url: str, session: Optional[requests.Session] = None) -> bytes:
-    """Download a PDF from a URL and return the raw bytes."""
+def fetch_menu_pdf(url: str, session: Optional[requests.Session] = None) -> io.BytesIO:
+    """Download a PDF from a URL into an in-memory buffer.
+
+    Streaming straight into the buffer avoids holding a second full copy
+    of the PDF as an intermediate bytes object.
+    """
     session = session or requests.Session()
-    r = session.get(url)
-    r.raise_for_status()
-    return r.content
+    with session.get(url, stream=True) as r:
+        r.raise_for_status()
+        buf = io.BytesIO()
+        # iter_content (unlike reading r.raw) applies content decoding and
+        # plays nicely with cached sessions
+        for chunk in r.iter_content(65536):
+            buf.write(chunk)
+    buf.seek(0)
+    return buf
+
+
+def target_date_str(date: Optional[datetime] = None) -> str:
+    """Today's date (Europe/Berlin) in the PDF's DD.MM.YYYY format."""
+    return (date or datetime.now(BERLIN_TZ)).strftime("%d.%m.%Y")
 
 
-def extract_pdf_text(pdf_bytes: bytes) -> List[List[List[str]]]:
-    """Extract tables from all pages of a PDF as nested lists."""
-    tables = []
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+def iter_pdf_tables(pdf_buf: io.BytesIO) -> Iterator[List[List[str]]]:
+    """Yield each page's table lazily.
+
+    pdfplumber page parsing is the dominant cost here; a consumer that
+    stops at the first hit (today's row usually sits on page 1) never
+    pays for the remaining pages.
+    """
+    with pdfplumber.open(pdf_buf) as pdf:
         for page in pdf.pages:
-            tables.append(page.extract_table() or [])
-    return tables
+            yield page.extract_table() or []
 
 
 def find_daily_menu(
-    tables: List[List[List[str]]], date: Optional[datetime] = None
+    tables: Iterable[List[List[str]]], date: Optional[datetime] = None
 ) -> List[str]:
-    """Search the PDF tables for today's menu row."""
-    date_str = (date or datetime.now(ZoneInfo("Europe/Berlin"))).strftime("%d.%m.%Y")
+    """Search the PDF tables for today's menu row.
+
+    Stops consuming on the first match, so passing the iter_pdf_tables
+    generator aborts page parsing as soon as the row is found.
+    """
+    date_str = target_date_str(date)
     for page in tables:
         for row in page:
-            if any(date_str in col for col in row if col):
-                return row
+            for col in row:
+                if col and date_str in col:
+                    return row
     return []
 
 
@@ -89,11 +121,13 @@ def find_daily_menu(
 if __name__ == "__main__":
     url = "https://desy.myalsterfood.de/download/en/menu.pdf"
 
-    pdf_tables = extract_pdf_text(fetch_menu_pdf(url))
-    daily_menu = find_daily_menu(pdf_tables)
+    pages = iter_pdf_tables(fetch_menu_pdf(url))
+    first_page = next(pages, [])  # first row of page 1 is the header
+    daily_menu = find_daily_menu(chain([first_page], pages))
+    pages.close()
 
     if daily_menu:
-        header = pdf_tables[0][0]  # first row is header
+        header = first_page[0]
         print(clean_menu_text(header, daily_menu))
     else:
         print("Today's menu not found.")
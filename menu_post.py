@@ -1,33 +1,54 @@
 import os
+import re
+import sys
 import requests
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import io
 import pdfplumber
+import pypdfium2
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from desy import extract_pdf_text, fetch_menu_pdf, find_daily_menu, clean_menu_text
-from cfel import scrape_headlines_and_prices, format_menus  # noqa
+from itertools import chain
+from desy import iter_pdf_tables, fetch_menu_pdf, find_daily_menu, clean_menu_text
+from cfel import HEADERS, scrape_headlines_and_prices, format_menus  # noqa
 
 MENU_PAGE_URL = "https://www.labcuisine.de/menu/"
 DESY_URL = "https://desy.myalsterfood.de/download/en/menu.pdf"
 CFEL_URL = "https://www.stwhh.de/gastronomie/mensen-cafes-weiteres/mensa/cafe-cfel"
 
+BERLIN_TZ = ZoneInfo("Europe/Berlin")
+# index by datetime.weekday(); None on weekend
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", None, None)
+# one C-level scan for all five weekday names at once
+_WEEKDAYS_RE = re.compile(r"monday|tuesday|wednesday|thursday|friday")
+
+# One session for all scrapers: keep-alive amortizes TCP/TLS handshakes
+# across the four HTTP requests a run makes. The disk-backed cache honours
+# ETag/Last-Modified, so repeat runs within the hour turn unchanged
+# pages/PDFs into 304s instead of full downloads.
+SESSION = requests_cache.CachedSession(
+    "menu_cache", expire_after=3600, cache_control=True
+)
+SESSION.headers.update(HEADERS)
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 
 def get_target_day() -> str | None:
     """Return the weekday name ('monday'...'friday') based on Europe/Berlin time."""
-    berlin = ZoneInfo("Europe/Berlin")
-    today = datetime.now(berlin)
-    weekday = today.weekday()  # 0=Mon, ..., 6=Sun
-    mapping = {0: "monday", 1: "tuesday", 2: "wednesday", 3: "thursday", 4: "friday"}
-    return mapping.get(weekday)  # None on weekend
+    today = datetime.now(BERLIN_TZ)
+    return _WEEKDAYS[today.weekday()]  # 0=Mon, ..., 6=Sun
 
 
 def get_max_planck_pdf() -> str:
     """Find the first PDF link on the Max Planck menu page."""
-    resp = requests.get(MENU_PAGE_URL, timeout=10)
+    resp = SESSION.get(MENU_PAGE_URL, timeout=10)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, "lxml")
     for a in soup.find_all("a", href=True):
         href = a["href"]
         if href.lower().endswith(".pdf"):
@@ -37,18 +58,25 @@ def get_max_planck_pdf() -> str:
 
 def extract_menu_for_day(pdf_bytes: bytes, target_day: str = "tuesday") -> str:
     """Extract Max Planck menu for a specific day from weekly PDF."""
-    WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
     target_day = target_day.lower()
 
+    # Validate the page via pypdfium2 (PDFium, C++) first: raw text extraction
+    # there is an order of magnitude faster than pdfminer, so a PDF that does
+    # not look like the weekly menu bails out before any pdfplumber work.
+    doc = pypdfium2.PdfDocument(io.BytesIO(pdf_bytes))
+    try:
+        # this PDF has the English menu on page index 2
+        text = doc[2].get_textpage().get_text_bounded().lower()
+    finally:
+        doc.close()
+    if len(set(_WEEKDAYS_RE.findall(text))) != 5:
+        raise RuntimeError("This page does not look like the weekly menu page")
+
+    # pdfplumber is kept for its table-detection heuristics
     with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page = pdf.pages[2]  # this PDF has English menu on page index 2
-        text = (page.extract_text() or "").lower()
-        if not all(day in text for day in WEEKDAYS):
-            raise RuntimeError("This page does not look like the weekly menu page")
-
-        table = page.extract_table()
-        if not table:
-            raise RuntimeError("Could not extract table from menu page")
+        table = pdf.pages[2].extract_table()
+    if not table:
+        raise RuntimeError("Could not extract table from menu page")
 
     header = table[0]
     header_idx = next(
@@ -77,43 +105,53 @@ def extract_menu_for_day(pdf_bytes: bytes, target_day: str = "tuesday") -> str:
 
 def extract_desy_menu(target_day: str) -> str:
     """Fetch DESY menu PDF and extract today's menu in clean text format."""
-    pdf_bytes = fetch_menu_pdf(DESY_URL)
-    pdf_tables = extract_pdf_text(pdf_bytes)
-    daily_menu_row = find_daily_menu(pdf_tables)
+    pdf_buf = fetch_menu_pdf(DESY_URL, session=SESSION)
+    pages = iter_pdf_tables(pdf_buf)
+    first_page = next(pages, [])  # first row of page 1 is the header
+    daily_menu_row = find_daily_menu(chain([first_page], pages))
+    pages.close()  # don't parse pages beyond the one with today's row
     if not daily_menu_row:
         return f"No DESY menu found for {target_day.title()}"
-    header = pdf_tables[0][0]  # first row is header
+    header = first_page[0]
     return clean_menu_text(header, daily_menu_row)
 
 
 def send_to_mattermost(text: str):
     """Send a message to Mattermost via webhook."""
-    webhook_url = os.environ.get("MM_WEBHOOK_URL")
-    if not webhook_url:
-        print("GitHub secret not accessed")
-
-    resp = requests.post(webhook_url, json={"text": text}, timeout=10)
+    webhook_url = os.environ["MM_WEBHOOK_URL"]
+    # reuse the shared session (warm TLS) with split connect/read timeouts
+    resp = SESSION.post(webhook_url, json={"text": text}, timeout=(3, 10))
     resp.raise_for_status()
     print("Sent successfully:", resp.text)
 
 
 def main():
+    # Fail before scraping three sites if the result could not be posted anyway.
+    if not os.environ.get("MM_WEBHOOK_URL"):
+        sys.exit("MM_WEBHOOK_URL is not set (GitHub secret not accessed?)")
+
     today = get_target_day()
     if not today:
         print("No menu: today is weekend.")
         return
 
-    # Max Planck menu
-    mp_pdf_url = get_max_planck_pdf()
-    mp_pdf_resp = requests.get(mp_pdf_url, timeout=10)
-    mp_pdf_resp.raise_for_status()
-    mp_menu = extract_menu_for_day(mp_pdf_resp.content, today)
-
-    # DESY menu
-    desy_menu = extract_desy_menu(today)
-
-    # CFEL menu
-    cfel_menu = format_menus(scrape_headlines_and_prices(CFEL_URL))
+    def fetch_max_planck() -> tuple[str, str]:
+        mp_pdf_url = get_max_planck_pdf()
+        mp_pdf_resp = SESSION.get(mp_pdf_url, timeout=10)
+        mp_pdf_resp.raise_for_status()
+        return mp_pdf_url, extract_menu_for_day(mp_pdf_resp.content, today)
+
+    # The three sources are independent network-bound tasks; fetching them
+    # concurrently cuts wall-clock to roughly the slowest single source.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        mp_future = pool.submit(fetch_max_planck)
+        desy_future = pool.submit(extract_desy_menu, today)
+        cfel_future = pool.submit(
+            lambda: format_menus(scrape_headlines_and_prices(CFEL_URL, session=SESSION))
+        )
+        mp_pdf_url, mp_menu = mp_future.result()
+        desy_menu = desy_future.result()
+        cfel_menu = cfel_future.result()
 
     message = f"""
 @channel